@@ -88,32 +88,34 @@ class Monitoring:
 
         # - checking if the bmc monitoring works
         # These calls will also initialize the datastructures out of the monitoring loop
-        self.vendor.get_bmc().read_thermals(self.get_metric(Metrics.THERMAL))
-        check_monitoring(Metrics.THERMAL)
-
-        self.vendor.get_bmc().read_fans(self.get_metric(Metrics.FANS))
-        check_monitoring(Metrics.FANS)
-
-        self.vendor.get_bmc().read_power_consumption(
-            self.get_metric(Metrics.POWER_CONSUMPTION)
-        )
-        check_monitoring(Metrics.POWER_CONSUMPTION)
-
-        self.vendor.get_bmc().read_power_supplies(
-            self.get_metric(Metrics.POWER_SUPPLIES)
-        )
-        check_monitoring(Metrics.POWER_SUPPLIES)
+        bmc = self.vendor.get_bmc()
+        bmc.begin_sample()
+        for group, metric, read in self.__bmc_readers():
+            if not bmc.is_enabled(group):
+                print(f"Monitoring {str(metric)} metrics: disabled")
+                continue
+            read(self.get_metric(metric))
+            check_monitoring(metric)
+
+    def __bmc_readers(self):
+        """Return the bmc readers with their group and metric."""
+        bmc = self.vendor.get_bmc()
+        return [
+            ("thermal", Metrics.THERMAL, bmc.read_thermals),
+            ("fan", Metrics.FANS, bmc.read_fans),
+            ("power", Metrics.POWER_CONSUMPTION, bmc.read_power_consumption),
+            ("power", Metrics.POWER_SUPPLIES, bmc.read_power_supplies),
+        ]
 
     def __monitor_bmc(self):
         """Monitor the bmc metrics"""
-        self.vendor.get_bmc().read_thermals(self.get_metric(Metrics.THERMAL))
-        self.vendor.get_bmc().read_fans(self.get_metric(Metrics.FANS))
-        self.vendor.get_bmc().read_power_consumption(
-            self.get_metric(Metrics.POWER_CONSUMPTION)
-        )
-        self.vendor.get_bmc().read_power_supplies(
-            self.get_metric(Metrics.POWER_SUPPLIES)
-        )
+        # Let's fetch all the redfish endpoints of this sample in parallel before reading them
+        bmc = self.vendor.get_bmc()
+        bmc.begin_sample()
+        # Disabled groups of metrics are skipped, saving their redfish calls
+        for group, metric, read in self.__bmc_readers():
+            if bmc.is_enabled(group):
+                read(self.get_metric(metric))
 
     def __compact(self):
         """Compute statistics"""
@@ -1,9 +1,29 @@
+import numpy as np
 import statistics
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from typing import TypeVar
 
+T = TypeVar("T", bound=type)
 
+
+def add_slots(cls: T) -> T:
+    """Rebuild a dataclass with __slots__ instead of a per-instance __dict__."""
+    # dataclass(slots=True) is only available from python 3.10,
+    # this helper does the same for older versions.
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    # Class attributes holding the defaults would conflict with the slots
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@add_slots
 @dataclass
 class MonitorMetric:
     """A class to represent monitoring metrics"""
@@ -71,11 +91,17 @@ class MonitorMetric:
         """Compute new min/max/mean/stdev from values."""
         # Let's compute the stats for this run
         if len(self.values):
+            # min/max keep the type of the sensor values, like int RPMs,
+            # and mean stays exact: the exported values are unchanged.
             self.min.append(min(self.values))
             self.max.append(max(self.values))
             self.mean.append(statistics.mean(self.values))
+            # The sample stdev is the costly part, numpy computes it on a float array
             if len(self.values) > 1:
-                self.stdev.append(statistics.stdev(self.values))
+                values = np.fromiter(
+                    self.values, dtype=np.float64, count=len(self.values)
+                )
+                self.stdev.append(float(values.std(ddof=1)))
             else:
                 self.stdev.append(0.0)
             self.samples.append(len(self.values))
@@ -114,11 +140,15 @@ class Metrics(Enum):
 
 
 class Temperature(MonitorMetric):
+    __slots__ = ()
+
     def __init__(self, name: str, value=None):
         super().__init__(name, "Celsius", value=value)
 
 
 class Power(MonitorMetric):
+    __slots__ = ()
+
     def __init__(self, name: str, value=None):
         super().__init__(name, "Watts", value=value)
 
@@ -141,6 +171,10 @@ class FanContext(Enum):
         return str(self.value)
 
 
+# Metrics key of the fans, computed once as it is used at every monitoring sample
+FAN_KEY = str(FanContext.FAN)
+
+
 class CPUContext(Enum):
     CPU = "CPU"
 
@@ -156,6 +190,10 @@ class PowerContext(Enum):
         return str(self.value)
 
 
+# Metrics key of the BMC power readings, computed once like FAN_KEY
+BMC_KEY = str(PowerContext.BMC)
+
+
 class PowerCategories(Enum):
     #      4N CHASSIS            1N CHASSIS
     #  --------------------       ----------
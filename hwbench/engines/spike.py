@@ -136,7 +136,7 @@ class Spike(ExternalBench):
             self.parameters.get_monitoring()
             .vendor.get_bmc()
             .read_fans()
-            .get(str(monitoring_structs.FanContext.FAN))
+            .get(monitoring_structs.FAN_KEY)
         )
         return sum([fan.get_values()[-1] for _, fan in raw_fans.items()])
 
@@ -0,0 +1,266 @@
+import json
+import os
+import pathlib
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ..bench.monitoring_structs import BMC_KEY, FAN_KEY
+from .vendors import vendor
+from .vendors.mock import MockVendor
+
+
+class TestBMCConfig(object):
+    def test_config_file_cache(self, tmp_path: pathlib.Path):
+        config_file = tmp_path / "config.cfg"
+        config_file.write_text("[default]\nusername=admin\npassword=secret\n")
+
+        config = vendor.load_config_file(str(config_file))
+        assert config["default"]["username"] == "admin"
+        # An unchanged file must not be parsed again
+        assert vendor.load_config_file(str(config_file)) is config
+
+        # Any update of the file must be reflected
+        config_file.write_text("[default]\nusername=root\npassword=secret\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        new_config = vendor.load_config_file(str(config_file))
+        assert new_config is not config
+        assert new_config["default"]["username"] == "root"
+
+    def test_parse_config(self):
+        config = vendor.parse_config(
+            "# hwbench monitoring\n"
+            "[default]\n"
+            "username = admin\n"
+            "password=p@ss=word\n"
+            "\n"
+            "[HPE]\n"
+            "; iLO specific credentials\n"
+            "UserName: Administrator\n"
+            "password : secret  \n"
+        )
+        assert config == {
+            "default": {"username": "admin", "password": "p@ss=word"},
+            "HPE": {"username": "Administrator", "password": "secret"},
+        }
+        assert vendor.parse_config("") == {}
+
+    def test_parse_metric_groups(self):
+        # The command line and config.cfg accept the same syntax
+        assert vendor.parse_metric_groups("thermal, power,") == ["thermal", "power"]
+        assert vendor.parse_metric_groups(" fan ") == ["fan"]
+        assert vendor.parse_metric_groups("") == []
+
+
+class TestBMCRedfish(object):
+    def test_get_redfish_urls(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        bmc.redfish_obj = MagicMock()
+        urls = [f"/redfish/v1/Chassis/{index}" for index in range(20)]
+        with patch(
+            "hwbench.environment.vendors.vendor.BMC.get_redfish_url",
+            side_effect=lambda url: {"@odata.id": url},
+        ) as get_redfish_url:
+            output = bmc.get_redfish_urls(urls)
+        assert get_redfish_url.call_count == len(urls)
+        assert output == {url: {"@odata.id": url} for url in urls}
+        assert bmc.get_redfish_urls([]) == {}
+
+    def test_redfish_cache(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        bmc.redfish_obj = MagicMock()
+        bmc.redfish_obj.get.return_value.text = '{"Fans": []}'
+        url = "/redfish/v1/Chassis/1/Thermal"
+
+        # Within a sample, the same url is only fetched once
+        assert bmc.get_redfish_url(url) == {"Fans": []}
+        assert bmc.get_redfish_url(url) == {"Fans": []}
+        assert bmc.redfish_obj.get.call_count == 1
+
+        # A new sample must fetch fresh values
+        bmc.begin_sample()
+        assert bmc.get_redfish_url(url) == {"Fans": []}
+        assert bmc.redfish_obj.get.call_count == 2
+
+    def test_lazy_connect(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+
+        def connect_redfish():
+            bmc.redfish_obj = MagicMock()
+
+        with patch.object(bmc, "connect_redfish", side_effect=connect_redfish) as cr:
+            # Nothing is connected until a Redfish call is made
+            cr.assert_not_called()
+            redfish_obj = bmc.redfish_obj
+            assert bmc.redfish_obj is redfish_obj
+            cr.assert_called_once()
+
+    def test_redfish_errors(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        bmc.redfish_obj = MagicMock()
+        bmc.redfish_obj.get.side_effect = vendor.RetriesExhaustedError()
+        assert bmc.get_redfish_url("/redfish/v1/Chassis/1/Power") is None
+
+        bmc.redfish_obj.get.side_effect = None
+        bmc.redfish_obj.get.return_value.text = '{"error": {"code": "Base.1.4"}}'
+        assert bmc.get_redfish_url("/redfish/v1/Chassis/1/Thermal") == {}
+
+        # Empty or invalid bodies are logged and reported as no answer
+        response = bmc.redfish_obj.get.return_value
+        for index, text in enumerate(["", "<html>Internal Server Error</html>"]):
+            response.text = text
+            with patch("logging.error") as error:
+                assert bmc.get_redfish_url(f"/redfish/v1/Chassis/{index}") is None
+            error.assert_called_once()
+            assert f"/redfish/v1/Chassis/{index}" in error.call_args[0][0]
+
+    def test_missing_redfish_fields(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        # get_redfish_url() returns None or {} when the BMC fails to answer
+        for answer in [None, {}, {"Fans": None, "PowerSupplies": []}]:
+            with (
+                patch.object(bmc, "get_thermal", return_value=answer),
+                patch.object(bmc, "get_power", return_value=answer),
+            ):
+                assert bmc.read_fans({}) == {FAN_KEY: {}}
+                assert bmc.read_power_supplies({}) == {BMC_KEY: {}}
+                power = bmc.read_power_consumption({})
+                assert power[BMC_KEY]["Server"].get_values() == []
+        assert bmc.missing_fields == {"Fans", "PowerControl", "PowerSupplies"}
+
+    def test_enabled_groups(self, tmp_path: pathlib.Path, monkeypatch):
+        bmc = vendor.BMC(pathlib.Path(""), MagicMock())
+        bmc.vendor.name.return_value = "HPE"
+        assert bmc.enabled_groups == set(vendor.BMC_METRIC_GROUPS)
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "config.cfg").write_text(
+            "[default]\nmetrics = thermal\n[HPE]\nmetrics = thermal, power\n"
+        )
+        bmc.load_enabled_groups()
+        assert bmc.enabled_groups == {"thermal", "power"}
+
+        # Only the urls of the enabled groups are fetched
+        urls = {"thermal": ["/thermal"], "fan": ["/thermal"], "power": ["/power"]}
+        bmc.set_enabled_groups(["fan"])
+        with (
+            patch.object(bmc, "get_monitoring_urls", return_value=urls),
+            patch.object(bmc, "get_redfish_urls", return_value={}) as get_redfish_urls,
+        ):
+            bmc.prefetch_monitoring()
+        get_redfish_urls.assert_called_once_with(["/thermal"])
+
+    def test_redfish_root_cache(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setattr(vendor, "REDFISH_ROOT_CACHE_DIR", str(tmp_path))
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        bmc.info.ip = "10.0.0.1"
+        root = {"Links": {"Sessions": {"@odata.id": "/redfish/v1/Sessions"}}}
+
+        def get(client, path, *args, **kwargs):
+            return MagicMock(status=200, text=json.dumps(root))
+
+        with (
+            patch.object(bmc, "_resolve_credentials", return_value=("admin", "pass")),
+            patch.object(
+                vendor.CachedRootClient, "get", autospec=True, side_effect=get
+            ),
+            patch.object(vendor.CachedRootClient, "login") as login,
+        ):
+            # The first connection discovers the service root and saves it
+            bmc.connect_redfish()
+            assert vendor.CachedRootClient.get.call_count == 1
+            assert bmc.load_redfish_root() == root
+            assert (tmp_path / "10.0.0.1.json").exists()
+
+            # The next ones don't get it again
+            bmc.connect_redfish()
+            assert vendor.CachedRootClient.get.call_count == 1
+            assert bmc.redfish_obj.login_url == "/redfish/v1/Sessions"
+
+            # A stale cache is discarded and the service root discovered again
+            login.side_effect = [vendor.BadRequestError(), None]
+            bmc.connect_redfish()
+            assert vendor.CachedRootClient.get.call_count == 2
+            assert login.call_count == 4
+            assert bmc.load_redfish_root() == root
+
+            # An unreachable BMC keeps the cache and is not tried twice
+            login.side_effect = vendor.RetriesExhaustedError()
+            with patch("hwbench.utils.helpers.fatal") as fatal:
+                bmc.connect_redfish()
+            fatal.assert_called_once()
+            assert login.call_count == 5
+            assert bmc.load_redfish_root() == root
+
+    def test_close(self):
+        with vendor.BMC(pathlib.Path(""), None) as bmc:
+            redfish_obj = bmc.redfish_obj = MagicMock()
+            bmc.logged = True
+        redfish_obj.logout.assert_called_once()
+        assert bmc._redfish_obj is None
+        assert not bmc.logged
+
+        # A failing logout still releases the session, closing twice is harmless
+        bmc.redfish_obj = redfish_obj
+        bmc.logged = True
+        redfish_obj.logout.side_effect = vendor.RetriesExhaustedError()
+        with pytest.raises(vendor.RetriesExhaustedError):
+            bmc.close()
+        assert bmc._redfish_obj is None
+        bmc.close()
+        assert redfish_obj.logout.call_count == 2
+
+    def test_vendor_close(self):
+        mock_vendor = MockVendor(pathlib.Path(""), None)
+        redfish_obj = mock_vendor.get_bmc().redfish_obj = MagicMock()
+        mock_vendor.get_bmc().logged = True
+        # An expired session must not fail the run at exit
+        redfish_obj.logout.side_effect = vendor.BadRequestError()
+        mock_vendor.close()
+        redfish_obj.logout.assert_called_once()
+        assert mock_vendor.get_bmc()._redfish_obj is None
+
+    def test_concurrent_lazy_connect(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        bmc.info.ip = "10.0.0.1"
+        fetched_before_login = []
+
+        class SlowLoginClient(object):
+            def __init__(self, *_args, **_kwargs):
+                self.logged_in = False
+
+            def login(self):
+                # The other workers must wait for the session to be usable
+                time.sleep(0.2)
+                self.logged_in = True
+
+            def get(self, url, _args):
+                if not self.logged_in:
+                    fetched_before_login.append(url)
+                return MagicMock(text="{}")
+
+        with (
+            patch.object(bmc, "_resolve_credentials", return_value=("admin", "pass")),
+            patch.object(bmc, "load_redfish_root", return_value={}),
+            patch.object(vendor, "CachedRootClient", SlowLoginClient),
+        ):
+            output = bmc.get_redfish_urls(["/p", "/o", "/t"])
+        assert output == {"/p": {}, "/o": {}, "/t": {}}
+        assert fetched_before_login == []
+
+    def test_concurrent_failed_login(self):
+        bmc = vendor.BMC(pathlib.Path(""), None)
+        bmc.info.ip = "10.0.0.1"
+        with (
+            patch.object(bmc, "_resolve_credentials", return_value=("admin", "pass")),
+            patch.object(bmc, "load_redfish_root", return_value=None),
+            patch.object(
+                bmc, "login_redfish", side_effect=vendor.RetriesExhaustedError()
+            ) as login,
+            pytest.raises(SystemExit),
+        ):
+            bmc.get_redfish_urls(["/p", "/o", "/t"])
+        # An unreachable BMC or bad credentials must not be retried by each worker
+        login.assert_called_once()
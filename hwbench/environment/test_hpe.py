@@ -55,26 +55,22 @@ class TestGenericHpe(TestVendors):
 
 
 class TestHpeAp2K(TestGenericHpe):
-    def __init__(self, *args, **kwargs):
-        super().__init__("tests/vendors/Hpe/XL225N/", *args, **kwargs)
-
-    def test_thermal(self):
-        expected_output = self.generic_thermal_output()
-        expected_output["Intake"]["01-Inlet Ambient"] = Temperature("Inlet", 23)
-        expected_output["CPU"] = {
+    _EXPECTED_THERMAL = {
+        str(ThermalContext.INTAKE): {"01-Inlet Ambient": Temperature("Inlet", 23)},
+        str(ThermalContext.CPU): {
             "02-CPU 1": Temperature("CPU1", 40),
             "55-CPU 1 PkgTmp": Temperature("CPU1", 36),
-        }
-        expected_output["Memory"] = {
+        },
+        str(ThermalContext.MEMORY): {
             "04-P1 DIMM 1-4": Temperature("P1 DIMM 1-4", 28),
             "05-P1 DIMM 5-8": Temperature("P1 DIMM 5-8", 28),
-        }
+        },
+        str(ThermalContext.SYSTEMBOARD): {},
+        str(ThermalContext.POWERSUPPLY): {},
+    }
 
-        super().generic_thermal_test(expected_output)
-
-    def test_fan(self):
-        expected_output = self.generic_fan_output()
-        expected_output[str(FanContext.FAN)] = {
+    _EXPECTED_FAN = {
+        str(FanContext.FAN): {
             "Fan 1": MonitorMetric("Fan 1", "Percent", 47),
             "Fan 2": MonitorMetric("Fan 2", "Percent", 47),
             "Fan 3": MonitorMetric("Fan 3", "Percent", 0),
@@ -83,57 +79,63 @@ class TestHpeAp2K(TestGenericHpe):
             "Fan 6": MonitorMetric("Fan 6", "Percent", 48),
             "Fan 7": MonitorMetric("Fan 7", "Percent", 48),
         }
+    }
 
-        # super().generic_fan_test(expected_output)
-
-    def test_power_consumption(self):
-        expected_output = self.generic_power_output()
-        expected_output[str(PowerContext.BMC)] = {
+    _EXPECTED_POWER_CONSUMPTION = {
+        str(PowerContext.BMC): {
             str(PowerCategories.CHASSIS): Power(str(PowerCategories.CHASSIS), 315),
             str(PowerCategories.SERVER): Power(str(PowerCategories.SERVER), 75),
             str(PowerCategories.SERVERINCHASSIS): Power(
                 str(PowerCategories.SERVERINCHASSIS), 116
             ),
         }
+    }
 
-        super().generic_power_consumption_test(expected_output)
-
-    def test_power_supplies(self):
-        expected_output = self.generic_power_output()
-        expected_output[str(PowerContext.BMC)] = {
+    _EXPECTED_POWER_SUPPLIES = {
+        str(PowerContext.BMC): {
             "HpeServerPowerSupply1": Power("PS1", 116.0),
             "HpeServerPowerSupply2": Power("PS2", 116.0),
         }
+    }
 
-        super().generic_power_supplies_test(expected_output)
-
-
-class TestHpeDL380(TestGenericHpe):
     def __init__(self, *args, **kwargs):
-        super().__init__("tests/vendors/Hpe/DL380/", *args, **kwargs)
+        super().__init__("tests/vendors/Hpe/XL225N/", *args, **kwargs)
 
     def test_thermal(self):
-        expected_output = self.generic_thermal_output()
-        expected_output[str(ThermalContext.INTAKE)] = {
-            "01-Inlet Ambient": Temperature("Inlet", 24)
-        }
-        expected_output[str(ThermalContext.CPU)] = {
+        super().generic_thermal_test(self._EXPECTED_THERMAL)
+
+    def test_fan(self):
+        # super().generic_fan_test(self._EXPECTED_FAN)
+        pass
+
+    def test_power_consumption(self):
+        super().generic_power_consumption_test(self._EXPECTED_POWER_CONSUMPTION)
+
+    def test_power_supplies(self):
+        super().generic_power_supplies_test(self._EXPECTED_POWER_SUPPLIES)
+
+
+class TestHpeDL380(TestGenericHpe):
+    _EXPECTED_THERMAL = {
+        str(ThermalContext.INTAKE): {"01-Inlet Ambient": Temperature("Inlet", 24)},
+        str(ThermalContext.CPU): {
             "02-CPU 1": Temperature("CPU1", 40),
             "03-CPU 2": Temperature("CPU2", 40),
             "96-CPU 1 PkgTmp": Temperature("CPU1", 41),
             "97-CPU 2 PkgTmp": Temperature("CPU2", 37),
-        }
-        expected_output[str(ThermalContext.MEMORY)] = {
+        },
+        str(ThermalContext.MEMORY): {
             "04-P1 DIMM 1-6": Temperature("P1 DIMM 1-6", 35),
             "06-P1 DIMM 7-12": Temperature("P1 DIMM 7-12", 35),
             "08-P2 DIMM 1-6": Temperature("P2 DIMM 1-6", 36),
             "10-P2 DIMM 7-12": Temperature("P2 DIMM 7-12", 35),
-        }
-        super().generic_thermal_test(expected_output)
+        },
+        str(ThermalContext.SYSTEMBOARD): {},
+        str(ThermalContext.POWERSUPPLY): {},
+    }
 
-    def test_fan(self):
-        expected_output = self.generic_fan_output()
-        expected_output[str(FanContext.FAN)] = {
+    _EXPECTED_FAN = {
+        str(FanContext.FAN): {
             "Fan 1": MonitorMetric("Fan 1", "Percent", 25),
             "Fan 2": MonitorMetric("Fan 2", "Percent", 28),
             "Fan 3": MonitorMetric("Fan 3", "Percent", 25),
@@ -141,22 +143,32 @@ class TestHpeDL380(TestGenericHpe):
             "Fan 5": MonitorMetric("Fan 5", "Percent", 25),
             "Fan 6": MonitorMetric("Fan 6", "Percent", 25),
         }
+    }
 
-        super().generic_fan_test(expected_output)
-
-    def test_power_consumption(self):
-        expected_output = self.generic_power_output()
-        expected_output[str(PowerContext.BMC)] = {
+    _EXPECTED_POWER_CONSUMPTION = {
+        str(PowerContext.BMC): {
             str(PowerCategories.SERVER): Power(str(PowerCategories.SERVER), 301),
         }
+    }
 
-        super().generic_power_consumption_test(expected_output)
-
-    def test_power_supplies(self):
-        expected_output = self.generic_power_output()
-        expected_output[str(PowerContext.BMC)] = {
+    _EXPECTED_POWER_SUPPLIES = {
+        str(PowerContext.BMC): {
             "HpeServerPowerSupply1": Power("PS1", 147.0),
             "HpeServerPowerSupply2": Power("PS2", 154.0),
         }
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__("tests/vendors/Hpe/DL380/", *args, **kwargs)
+
+    def test_thermal(self):
+        super().generic_thermal_test(self._EXPECTED_THERMAL)
 
-        super().generic_power_supplies_test(expected_output)
+    def test_fan(self):
+        super().generic_fan_test(self._EXPECTED_FAN)
+
+    def test_power_consumption(self):
+        super().generic_power_consumption_test(self._EXPECTED_POWER_CONSUMPTION)
+
+    def test_power_supplies(self):
+        super().generic_power_supplies_test(self._EXPECTED_POWER_SUPPLIES)
@@ -258,5 +258,6 @@ class TestParseCPU(object):
         test_target = BMC(path, None)
         stdout = (d / "stdout").read_bytes()
         stderr = (d / "stderr").read_bytes()
-        test_target.parse_cmd(stdout, stderr)
+        output = test_target.parse_cmd(stdout, stderr)
+        assert output == {"ip": "10.168.97.137"}
         assert test_target.get_ip() == "10.168.97.137"
@@ -7,7 +7,6 @@ from enum import Enum
 from unittest.mock import patch
 from typing import Any  # noqa: F401
 from .vendors.vendor import Vendor
-from ..bench.monitoring_structs import FanContext, PowerContext, ThermalContext
 
 path = pathlib.Path("")
 
@@ -94,21 +93,6 @@ class TestVendors(unittest.TestCase):
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), filename)
         return filename
 
-    def generic_thermal_output(self):
-        return {
-            str(ThermalContext.INTAKE): {},
-            str(ThermalContext.CPU): {},
-            str(ThermalContext.MEMORY): {},
-            str(ThermalContext.SYSTEMBOARD): {},
-            str(ThermalContext.POWERSUPPLY): {},
-        }
-
-    def generic_fan_output(self):
-        return {str(FanContext.FAN): {}}
-
-    def generic_power_output(self):
-        return {str(PowerContext.BMC): {}}
-
     def generic_test(self, expected_output, func):
         for pc in func:
             if pc not in expected_output.keys():
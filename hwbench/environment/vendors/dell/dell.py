@@ -1,20 +1,31 @@
 from ....bench.monitoring_structs import (
+    BMC_KEY,
     Power,
     PowerCategories as PowerCat,
-    PowerContext,
     Temperature,
 )
 from ..vendor import Vendor, BMC
 
 
 class IDRAC(BMC):
+    THERMAL_URL = "/redfish/v1/Chassis/System.Embedded.1/Thermal"
+    POWER_URL = "/redfish/v1/Chassis/System.Embedded.1/Power"
+    OEM_SYSTEM_URL = "/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/DellAttributes/System.Embedded.1"
+
+    def get_monitoring_urls(self) -> dict[str, list[str]]:
+        return {
+            "thermal": [self.THERMAL_URL],
+            "fan": [self.THERMAL_URL],
+            "power": [self.POWER_URL, self.OEM_SYSTEM_URL],
+        }
+
     def get_thermal(self):
-        return self.get_redfish_url("/redfish/v1/Chassis/System.Embedded.1/Thermal")
+        return self.get_redfish_url(self.THERMAL_URL)
 
     def read_thermals(
         self, thermals: dict[str, dict[str, Temperature]] = {}
     ) -> dict[str, dict[str, Temperature]]:
-        for t in self.get_thermal().get("Temperatures"):
+        for t in self.get_redfish_field(self.get_thermal(), "Temperatures"):
             if t["ReadingCelsius"] is None or t["ReadingCelsius"] <= 0:
                 continue
             name = t["Name"].split("Temp")[0].strip()
@@ -27,63 +38,50 @@ class IDRAC(BMC):
         return thermals
 
     def get_power(self):
-        return self.get_redfish_url("/redfish/v1/Chassis/System.Embedded.1/Power")
+        return self.get_redfish_url(self.POWER_URL)
 
     def get_oem_system(self):
-        return self.get_redfish_url(
-            "/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/DellAttributes/System.Embedded.1"
-        )
+        return self.get_redfish_url(self.OEM_SYSTEM_URL)
 
     def read_power_consumption(
         self, power_consumption: dict[str, dict[str, Power]] = {}
     ):
         power_consumption = super().read_power_consumption(power_consumption)
-        oem_system = self.get_oem_system()
-        if "ServerPwr.1.SCViewSledPwr" in oem_system["Attributes"]:
+        attributes = (self.get_oem_system() or {}).get("Attributes") or {}
+        if "ServerPwr.1.SCViewSledPwr" in attributes:
             # ServerPwr.1.SCViewSledPwr is computed from other metrics
             # It includes the SLED power consumption + a mathematical portion of the chassis consumption
             # It's computed like : ServerPwr.1.SCViewSledPwr = PowerConsumedWatts + 'SC-BMC.1.ChassisInfraPower / nb_servers'
-            if (
-                str(PowerCat.SERVERINCHASSIS)
-                not in power_consumption[str(PowerContext.BMC)]
-            ):
-                power_consumption[str(PowerContext.BMC)][
+            if str(PowerCat.SERVERINCHASSIS) not in power_consumption[BMC_KEY]:
+                power_consumption[BMC_KEY][str(PowerCat.SERVERINCHASSIS)] = Power(
                     str(PowerCat.SERVERINCHASSIS)
-                ] = Power(str(PowerCat.SERVERINCHASSIS))
-            power_consumption[str(PowerContext.BMC)][str(PowerCat.SERVERINCHASSIS)].add(
-                oem_system["Attributes"]["ServerPwr.1.SCViewSledPwr"]
+                )
+            power_consumption[BMC_KEY][str(PowerCat.SERVERINCHASSIS)].add(
+                attributes["ServerPwr.1.SCViewSledPwr"]
             )
-        if "SC-BMC.1.ChassisInfraPower" in oem_system["Attributes"]:
+        if "SC-BMC.1.ChassisInfraPower" in attributes:
             # SC-BMC.1.ChassisInfraPower reports the power consumption of the chassis infrastructure,
             # not counting the SLEDs
-            if (
-                str(PowerCat.INFRASTRUCTURE)
-                not in power_consumption[str(PowerContext.BMC)]
-            ):
-                power_consumption[str(PowerContext.BMC)][
+            if str(PowerCat.INFRASTRUCTURE) not in power_consumption[BMC_KEY]:
+                power_consumption[BMC_KEY][str(PowerCat.INFRASTRUCTURE)] = Power(
                     str(PowerCat.INFRASTRUCTURE)
-                ] = Power(str(PowerCat.INFRASTRUCTURE))
-            power_consumption[str(PowerContext.BMC)][str(PowerCat.INFRASTRUCTURE)].add(
-                oem_system["Attributes"]["SC-BMC.1.ChassisInfraPower"]
+                )
+            power_consumption[BMC_KEY][str(PowerCat.INFRASTRUCTURE)].add(
+                attributes["SC-BMC.1.ChassisInfraPower"]
             )
 
         # Let's add the sum of the power supplies to get the inlet power consumption
         # It will be compared at some point with the PDU reporting.
-        if str(PowerCat.CHASSIS) not in power_consumption[str(PowerContext.BMC)]:
-            power_consumption[str(PowerContext.BMC)][str(PowerCat.CHASSIS)] = Power(
+        if str(PowerCat.CHASSIS) not in power_consumption[BMC_KEY]:
+            power_consumption[BMC_KEY][str(PowerCat.CHASSIS)] = Power(
                 str(PowerCat.CHASSIS)
             )
-        psus = super().read_power_supplies()
-        power_consumption[str(PowerContext.BMC)][str(PowerCat.CHASSIS)].add(
-            float(
-                sum(
-                    [
-                        psu.get_values()[-1]
-                        for _, psu in psus[str(PowerContext.BMC)].items()
-                    ]
-                )
+        # The power supplies of this sample only, the chassis is not reported if none answered
+        psus = super().read_power_supplies({})
+        if psus[BMC_KEY]:
+            power_consumption[BMC_KEY][str(PowerCat.CHASSIS)].add(
+                float(sum([psu.get_values()[-1] for _, psu in psus[BMC_KEY].items()]))
             )
-        )
 
         return power_consumption
 
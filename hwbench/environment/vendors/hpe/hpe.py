@@ -1,9 +1,9 @@
 import pathlib
 import re
 from ....bench.monitoring_structs import (
+    BMC_KEY,
     Power,
     PowerCategories as PowerCat,
-    PowerContext,
     Temperature,
 )
 from ..vendor import Vendor, BMC
@@ -11,6 +11,10 @@ from .ilorest import Ilorest, IlorestServerclone, ILOREST
 
 
 class ILO(BMC):
+    THERMAL_URL = "/redfish/v1/Chassis/1/Thermal"
+    POWER_URL = "/redfish/v1/Chassis/1/Power/"
+    OEM_CHASSIS_URL = "/redfish/v1/Chassis/enclosurechassis/"
+
     def __init__(self, out_dir: pathlib.Path, vendor: Vendor, ilo: ILOREST):
         super().__init__(out_dir, vendor)
         self.ilo = ilo
@@ -18,13 +22,20 @@ class ILO(BMC):
     def get_ip(self) -> str:
         return self.ilo.get_ip()
 
+    def get_monitoring_urls(self) -> dict[str, list[str]]:
+        return {
+            "thermal": [self.THERMAL_URL],
+            "fan": [self.THERMAL_URL],
+            "power": [self.POWER_URL, self.OEM_CHASSIS_URL],
+        }
+
     def get_thermal(self):
-        return self.get_redfish_url("/redfish/v1/Chassis/1/Thermal")
+        return self.get_redfish_url(self.THERMAL_URL)
 
     def read_thermals(
         self, thermals: dict[str, dict[str, Temperature]] = {}
     ) -> dict[str, dict[str, Temperature]]:
-        for t in self.get_thermal().get("Temperatures"):
+        for t in self.get_redfish_field(self.get_thermal(), "Temperatures"):
             if t["ReadingCelsius"] <= 0:
                 continue
             pc = t["PhysicalContext"]
@@ -65,24 +76,23 @@ class ILO(BMC):
         return thermals
 
     def get_power(self):
-        return self.get_redfish_url("/redfish/v1/Chassis/1/Power/")
+        return self.get_redfish_url(self.POWER_URL)
 
     def read_power_supplies(
         self, power_supplies: dict[str, dict[str, Power]] = {}
     ) -> dict[str, dict[str, Power]]:
         """Return power supplies power from server"""
-        if str(PowerContext.BMC) not in power_supplies:
-            power_supplies[str(PowerContext.BMC)] = {}  # type: ignore[no-redef]
-        for psu in self.get_power().get("PowerSupplies"):
+        psu_metrics = power_supplies.setdefault(BMC_KEY, {})
+        for psu in self.get_redfish_field(self.get_power(), "PowerSupplies"):
+            oem = psu["Oem"]["Hpe"]
             # Both PSUs are named the same (HpeServerPowerSupply)
             # Let's update it to have a unique name
-            name = psu["Name"] + str(psu["Oem"]["Hpe"]["BayNumber"])
-            psu_name = "PS" + str(psu["Oem"]["Hpe"]["BayNumber"])
-            if name not in power_supplies[str(PowerContext.BMC)]:
-                power_supplies[str(PowerContext.BMC)][name] = Power(psu_name)
-            power_supplies[str(PowerContext.BMC)][name].add(
-                psu["Oem"]["Hpe"]["AveragePowerOutputWatts"]
-            )
+            bay = str(oem["BayNumber"])
+            name = psu["Name"] + bay
+            metric = psu_metrics.get(name)
+            if metric is None:
+                metric = psu_metrics[name] = Power("PS" + bay)
+            metric.add(oem["AveragePowerOutputWatts"])
 
         return power_supplies
 
@@ -98,31 +108,33 @@ class ILO(BMC):
 
         # But for multi-server chassis, ...
         if "HPE Apollo2000 Gen10+" in oem_chassis["Name"]:
-            if str(PowerContext.BMC) not in power_consumption:
-                power_consumption[str(PowerContext.BMC)] = {
+            if BMC_KEY not in power_consumption:
+                power_consumption[BMC_KEY] = {
                     str(PowerCat.SERVER): Power(str(PowerCat.SERVER)),
                     str(PowerCat.CHASSIS): Power(str(PowerCat.CHASSIS)),
                     str(PowerCat.SERVERINCHASSIS): Power(str(PowerCat.SERVERINCHASSIS)),
                 }  # type: ignore[no-redef]
 
             # On Apollo2000, the generic PowerConsumedWatts is fact SERVERINCHASSIS
-            power_consumption[str(PowerContext.BMC)][str(PowerCat.SERVERINCHASSIS)].add(
-                self.get_power().get("PowerControl")[0]["PowerConsumedWatts"]
-            )
+            power_control = self.get_redfish_field(self.get_power(), "PowerControl")
+            if power_control:
+                power_consumption[BMC_KEY][str(PowerCat.SERVERINCHASSIS)].add(
+                    power_control[0]["PowerConsumedWatts"]
+                )
 
             # And extract SERVER from NodePowerWatts
-            power_consumption[str(PowerContext.BMC)][str(PowerCat.SERVER)].add(
+            power_consumption[BMC_KEY][str(PowerCat.SERVER)].add(
                 oem_chassis["Oem"]["Hpe"]["NodePowerWatts"]
             )
 
             # And CHASSIS from ChassisPowerWatts
-            power_consumption[str(PowerContext.BMC)][str(PowerCat.CHASSIS)].add(
+            power_consumption[BMC_KEY][str(PowerCat.CHASSIS)].add(
                 oem_chassis["Oem"]["Hpe"]["ChassisPowerWatts"]
             )
         return power_consumption
 
     def get_oem_chassis(self):
-        return self.get_redfish_url("/redfish/v1/Chassis/enclosurechassis/")
+        return self.get_redfish_url(self.OEM_CHASSIS_URL)
 
 
 class Hpe(Vendor):
@@ -1,8 +1,8 @@
 from ...bench.monitoring_structs import (
-    FanContext,
+    BMC_KEY,
+    FAN_KEY,
     MonitorMetric,
     Power,
-    PowerContext,
     Temperature,
     ThermalContext,
 )
@@ -24,14 +24,14 @@ class MockedBMC(BMC):
         self, fans: dict[str, dict[str, MonitorMetric]] = {}
     ) -> dict[str, dict[str, MonitorMetric]]:
         # Let's add a faked fans metric
-        fans[str(FanContext.FAN)] = {"Fan1": MonitorMetric("Fan1", "RPM", 40)}
+        fans[FAN_KEY] = {"Fan1": MonitorMetric("Fan1", "RPM", 40)}
         return fans
 
     def read_power_consumption(
         self, power_consumption: dict[str, dict[str, Power]] = {}
     ) -> dict[str, dict[str, Power]]:
         # Let's add a faked power metric
-        power_consumption[str(PowerContext.BMC)] = {"Chassis": Power("Chassis", 125.0)}
+        power_consumption[BMC_KEY] = {"Chassis": Power("Chassis", 125.0)}
         return power_consumption
 
     def read_power_supplies(
@@ -39,7 +39,7 @@ class MockedBMC(BMC):
     ) -> dict[str, dict[str, Power]]:
         # Let's add a faked power supplies
 
-        power_supplies[str(PowerContext.BMC)] = {"PS1 status": Power("PS1", 125.0)}
+        power_supplies[BMC_KEY] = {"PS1 status": Power("PS1", 125.0)}
         return power_supplies
 
 
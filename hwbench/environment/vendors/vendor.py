@@ -1,47 +1,180 @@
-import configparser
-import cachetools.func
+import cachetools
+import concurrent.futures
 import json
 import logging
+import orjson
+import os
 import pathlib
-import redfish  # type: ignore
+import re
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from json import JSONDecodeError
+from redfish.rest.v1 import (  # type: ignore
+    BadRequestError,
+    HttpClient,
+    InvalidCredentialsError,
+    JsonDecodingError,
+    RetriesExhaustedError,
+    RisObject,
+    ServerDownOrUnreachableError,
+    SessionCreationError,
+)
+from typing import Optional
 from ...utils import helpers as h
 from ...utils.external import External
 from ...bench.monitoring_structs import (
-    FanContext,
+    add_slots,
+    BMC_KEY,
+    FAN_KEY,
     Power,
     PowerCategories,
-    PowerContext,
     MonitorMetric,
     Temperature,
 )
 
+# The groups of metrics a BMC can report, each one costs Redfish calls at every sample
+BMC_METRIC_GROUPS = ("thermal", "fan", "power")
+
+# Parsed configuration files, keyed by (absolute path, mtime in ns)
+# Re-parsing only occurs when the file is modified on disk
+_CFG_CACHE: dict[tuple[str, int], dict[str, dict[str, str]]] = {}
+_CFG_CACHE_LOCK = threading.Lock()
+
+# A "[section]" header of the configuration file
+_CFG_SECTION_RE = re.compile(r"^[ \t]*\[([^\]\n]+)\][ \t\r]*$", re.M)
+# A "key = value" or "key: value" line, comments starting by # or ; are skipped
+_CFG_OPTION_RE = re.compile(
+    r"^[ \t]*([^#;\s=:][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t\r]*$", re.M
+)
+
+# The "IP Address" line of ipmitool, the only field of its output used by hwbench
+_IP_RE = re.compile(rb"^IP Address[ \t]*:[ \t]*(\S+)", re.M)
+
+# Maximum number of Redfish urls fetched in parallel
+REDFISH_MAX_WORKERS = 8
+# How long, in seconds, a Redfish answer can be reused
+REDFISH_CACHE_TTL = 1.5
+# Where the Redfish service roots of the BMCs are kept between runs
+REDFISH_ROOT_CACHE_DIR = "~/.cache/hwbench"
+
+
+def parse_metric_groups(value: str) -> list[str]:
+    """Return the groups of metrics of a comma separated list, like "thermal, power"."""
+    return [group.strip() for group in value.split(",") if group.strip()]
+
+
+def parse_config(content: str) -> dict[str, dict[str, str]]:
+    """Return the options of an ini-like content, grouped by section."""
+    # Only the simple "key = value" syntax used by config.cfg is supported:
+    # no multi-line values, no interpolation and no DEFAULT inheritance.
+    # Like configparser, option names are case-insensitive.
+    config: dict[str, dict[str, str]] = {}
+    headers = list(_CFG_SECTION_RE.finditer(content))
+    for header, next_header in zip(headers, headers[1:] + [None]):
+        end = next_header.start() if next_header else len(content)
+        options = config.setdefault(header[1].strip(), {})
+        for option in _CFG_OPTION_RE.finditer(content, header.end(), end):
+            options[option[1].lower()] = option[2]
+    return config
+
+
+def load_config_file(path: str) -> dict[str, dict[str, str]]:
+    """Return the parsed configuration file, reusing a cached version if unchanged."""
+    abspath = os.path.abspath(path)
+    try:
+        mtime = os.stat(abspath).st_mtime_ns
+    except FileNotFoundError:
+        mtime = 0
+    with _CFG_CACHE_LOCK:
+        config = _CFG_CACHE.get((abspath, mtime))
+        if config is None:
+            try:
+                config = parse_config(pathlib.Path(abspath).read_text())
+            except FileNotFoundError:
+                config = {}
+            # Older versions of this file are useless now
+            for key in [key for key in _CFG_CACHE if key[0] == abspath]:
+                del _CFG_CACHE[key]
+            _CFG_CACHE[(abspath, mtime)] = config
+    return config
+
+
+@add_slots
+@dataclass
+class BmcInfo:
+    """The BMC properties extracted from ipmitool."""
+
+    ip: str
+
+
+class CachedRootClient(HttpClient):
+    """A Redfish client able to reuse the service root of a previous run."""
+
+    def __init__(self, *args, root_data: Optional[dict] = None, **kwargs):
+        # Must be set before the parent constructor calls get_root_object()
+        self.root_data = root_data
+        super().__init__(*args, **kwargs)
+
+    def get_root_object(self):
+        if self.root_data is None:
+            super().get_root_object()
+            self.root_data = orjson.loads(self.root_resp.text)
+            return
+        # The service root is only used to find the login url,
+        # there is no need to get it again from the BMC.
+        self.root = RisObject.parse(self.root_data)
+        self.root_resp = None
+
 
 class BMC(External):
-    def __init__(self, out_dir: pathlib.Path, vendor):
+    def __init__(
+        self, out_dir: pathlib.Path, vendor, redfish_cache_ttl=REDFISH_CACHE_TTL
+    ):
         super().__init__(out_dir)
-        self.bmc = {}  # type: dict[str, str]
-        self.config_file: configparser.ConfigParser
-        self.redfish_obj = None
+        self.info = BmcInfo(ip="")
+        self.config_file: dict[str, dict[str, str]]
+        self._redfish_obj = None
+        self.redfish_lock = threading.RLock()
         self.vendor = vendor
         self.logged = False
+        self.redfish_cache: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=128, ttl=redfish_cache_ttl
+        )
+        self.redfish_cache_lock = threading.Lock()
+        self.enabled_groups: set[str] = set(BMC_METRIC_GROUPS)
+        # Redfish fields already reported as missing
+        self.missing_fields: set[str] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
 
-    def __del__(self):
-        if self.logged:
-            self.redfish_obj.logout()
+    def close(self):
+        """Close the Redfish session, if any."""
+        # Logging out must not be left to the garbage collector:
+        # at interpreter shutdown, the modules needed by the request may be gone.
+        with self.redfish_lock:
+            if self._redfish_obj is None:
+                return
+            try:
+                if self.logged:
+                    self._redfish_obj.logout()
+            finally:
+                self._redfish_obj = None
+                self.logged = False
 
     def run_cmd(self) -> list[str]:
         return ["ipmitool", "lan", "print"]
 
     def parse_cmd(self, stdout: bytes, _stderr: bytes):
-        for row in stdout.split(b"\n"):
-            if b": " in row:
-                key, value = row.split(b": ", 1)
-                if key.strip():
-                    self.bmc[key.strip().decode("utf-8")] = value.strip().decode(
-                        "utf-8"
-                    )
-        return self.bmc
+        # Only the IP address is needed, there is no need to parse the other lines
+        match = _IP_RE.search(stdout)
+        if match:
+            self.info.ip = match[1].decode("utf-8")
+        return asdict(self.info)
 
     def run_cmd_version(self) -> list[str]:
         return ["ipmitool", "-V"]
@@ -56,21 +189,58 @@ class BMC(External):
 
     def get_ip(self) -> str:
         """Extract the BMC IP."""
-        try:
-            ip = self.bmc["IP Address"]
-        except KeyError:
+        if not self.info.ip:
             h.fatal("Cannot detect BMC ip")
 
-        return ip
+        return self.info.ip
 
-    def connect_redfish(self):
-        """Connect to the bmc using Redfish."""
-        self.config_file = configparser.ConfigParser(allow_no_value=True)
-        self.config_file.read("config.cfg")
+    @property
+    def redfish_obj(self):
+        """Return the Redfish session, connecting to the bmc on first use."""
+        if self._redfish_obj is None:
+            with self.redfish_lock:
+                # Another thread may have connected while we were waiting
+                if self._redfish_obj is None:
+                    self.connect_redfish()
+        return self._redfish_obj
+
+    @redfish_obj.setter
+    def redfish_obj(self, redfish_obj):
+        self._redfish_obj = redfish_obj
+
+    def get_config_sections(self) -> list[str]:
+        """Return the sections of the configuration file used by this bmc, by priority."""
+        return [self.vendor.name(), "default"]
+
+    def set_enabled_groups(self, groups: list[str]):
+        """Select the groups of metrics to monitor."""
+        unknown = set(groups) - set(BMC_METRIC_GROUPS)
+        if unknown:
+            h.fatal(
+                f"Unknown BMC metrics {sorted(unknown)}, valid ones are {BMC_METRIC_GROUPS}"
+            )
+        self.enabled_groups = set(groups)
+
+    def load_enabled_groups(self):
+        """Select the groups of metrics to monitor from the configuration file."""
+        # The "metrics" option is optional, all groups are monitored by default
+        config = load_config_file("config.cfg")
+        for section in self.get_config_sections():
+            if "metrics" in config.get(section, {}):
+                self.set_enabled_groups(parse_metric_groups(config[section]["metrics"]))
+                return
+
+    def is_enabled(self, group: str) -> bool:
+        """Return if a group of metrics is monitored."""
+        return group in self.enabled_groups
+
+    def _resolve_credentials(self) -> tuple[str, str]:
+        """Return the username and password to connect to the bmc."""
+        self.config_file = load_config_file("config.cfg")
         section_name = ""
-        sections = [self.vendor.name(), "default"]
+        sections = self.get_config_sections()
         for section in sections:
-            if section in self.config_file.sections():
+            if section in self.config_file:
                 section_name = section
                 break
         if not section_name:
@@ -78,52 +248,196 @@ class BMC(External):
                 f"Cannot find any section of  {sections} in monitoring configuration file"
             )
 
-        bmc_username = self.config_file.get(section_name, "username")
-        bmc_password = self.config_file.get(section_name, "password")
+        options = self.config_file[section_name]
+        for option in ["username", "password"]:
+            if option not in options:
+                h.fatal(f"Cannot find {option} in section {section_name}")
+        return options["username"], options["password"]
+
+    def connect_redfish(self):
+        """Connect to the bmc using Redfish."""
+        bmc_username, bmc_password = self._resolve_credentials()
         server_url = self.get_ip()
         try:
             if "https://" not in server_url:
                 server_url = "https://{}".format(server_url)
-            self.redfish_obj = redfish.redfish_client(
-                base_url=server_url,
-                username=bmc_username,
-                password=bmc_password,
-                default_prefix="/redfish/v1",
-                timeout=10,
-            )
-            self.redfish_obj.login()
+            redfish_obj = None
+            root_data = self.load_redfish_root()
+            if root_data is not None:
+                try:
+                    redfish_obj = self.login_redfish(
+                        server_url, bmc_username, bmc_password, root_data
+                    )
+                except (
+                    BadRequestError,
+                    ServerDownOrUnreachableError,
+                    SessionCreationError,
+                ):
+                    # The login url was refused: the BMC may have been updated
+                    # since the service root was cached. Connectivity errors and
+                    # invalid credentials are not related to the cache.
+                    logging.info(
+                        f"Cached Redfish service root of {server_url} is stale"
+                    )
+                    self.invalidate_redfish_root()
+            if redfish_obj is None:
+                redfish_obj = self.login_redfish(server_url, bmc_username, bmc_password)
+                self.save_redfish_root(redfish_obj.root_data)
+            # The session is only published once logged in,
+            # the other threads must not use it before.
             self.logged = True
-        except json.decoder.JSONDecodeError:
+            self.redfish_obj = redfish_obj
+        except (JSONDecodeError, JsonDecodingError):
             h.fatal("JSONDecodeError on {}".format(server_url))
-        except redfish.rest.v1.RetriesExhaustedError:
+        except RetriesExhaustedError:
             h.fatal("RetriesExhaustedError on {}".format(server_url))
-        except redfish.rest.v1.BadRequestError:
+        except BadRequestError:
             h.fatal("BadRequestError on {}".format(server_url))
-        except redfish.rest.v1.InvalidCredentialsError:
+        except InvalidCredentialsError:
             h.fatal("Invalid credentials for {}".format(server_url))
         except Exception as exception:
             h.fatal(type(exception))
 
-    @cachetools.func.ttl_cache(maxsize=128, ttl=1.5)
+    def login_redfish(
+        self,
+        server_url: str,
+        username: str,
+        password: str,
+        root_data: Optional[dict] = None,
+    ) -> CachedRootClient:
+        """Return a logged in Redfish session, the service root is fetched if not provided."""
+        redfish_obj = CachedRootClient(
+            base_url=server_url,
+            username=username,
+            password=password,
+            default_prefix="/redfish/v1",
+            timeout=10,
+            root_data=root_data,
+        )
+        redfish_obj.login()
+        return redfish_obj
+
+    def get_redfish_root_path(self) -> pathlib.Path:
+        """Return the file caching the Redfish service root of this bmc."""
+        return (
+            pathlib.Path(REDFISH_ROOT_CACHE_DIR).expanduser() / f"{self.get_ip()}.json"
+        )
+
+    def load_redfish_root(self) -> Optional[dict]:
+        """Return the Redfish service root saved by a previous run, if any."""
+        try:
+            return orjson.loads(self.get_redfish_root_path().read_text())
+        except (OSError, JSONDecodeError):
+            return None
+
+    def save_redfish_root(self, root_data: dict):
+        """Save the Redfish service root for the next runs."""
+        # The cache is an optimization, not being able to write it is not an error
+        path = self.get_redfish_root_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(root_data))
+        except OSError as exception:
+            logging.debug(
+                f"Cannot save the Redfish service root to {path}: {exception}"
+            )
+
+    def invalidate_redfish_root(self):
+        """Forget the cached Redfish service root."""
+        try:
+            self.get_redfish_root_path().unlink()
+        except OSError:
+            pass
+
+    @cachetools.cachedmethod(
+        lambda self: self.redfish_cache, lock=lambda self: self.redfish_cache_lock
+    )
     def get_redfish_url(self, url):
         """Return the content of a Redfish url."""
         # The same url can be called several times like read_thermals() and read_fans() consuming the same redfish endpoint.
         # To avoid multiplicating identical redfish calls, a ttl cache is implemented to avoid multiple redfish calls in a row.
+        # The cache is flushed by begin_sample() so every monitoring sample gets fresh values.
         # As we want to keep a possible high frequency (< 5sec) precision, let's consider the cache must live up to 1.5 seconds
         try:
-            redfish = self.redfish_obj.get(url, None).dict
+            response = self.redfish_obj.get(url, None)
+            # orjson is much faster than json on large payloads.
+            # Like RestResponse.dict of the pinned redfish 3.2.2,
+            # an empty or invalid body is reported as a decoding error.
+            try:
+                content = orjson.loads(response.text)
+            except JSONDecodeError:
+                logging.error(
+                    f"Redfish url {url} responded with invalid JSON: {response.text}"
+                )
+                return None
             # Let's ignore errors and return empty objects
             # It will be up to the caller to see there is no answer and process this
             # {'error': {'code': 'iLO.0.10.ExtendedInfo', 'message': 'See @Message.ExtendedInfo for more information.', '@Message.ExtendedInfo': [{'MessageArgs': ['/redfish/v1/Chassis/enclosurechassis/'], 'MessageId': 'Base.1.4.ResourceMissingAtURI'}]}}
-            if redfish and "error" in redfish:
-                logging.error(f"Parsing redfish url {url} failed : {redfish}")
+            if content and "error" in content:
+                logging.error(f"Parsing redfish url {url} failed : {content}")
                 return {}
-            return redfish
-        except redfish.rest.v1.RetriesExhaustedError:
+            return content
+        except RetriesExhaustedError:
             return None
-        except json.decoder.JSONDecodeError:
+        except (JSONDecodeError, JsonDecodingError):
             return None
 
+    def get_redfish_urls(self, urls: list[str]) -> dict[str, dict]:
+        """Return the content of several Redfish urls, fetched concurrently."""
+        # Fetching is bound by the BMC latency, not the bandwidth.
+        # As get_redfish_url() is cached, the results are also reused by
+        # the next calls on the same urls, like get_thermal() or get_power().
+        if not urls:
+            return {}
+        # Let's connect before spreading the urls over the workers:
+        # a failing login must be tried once, not by every worker.
+        if self.redfish_obj is None:
+            return {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(urls), REDFISH_MAX_WORKERS)
+        ) as executor:
+            return dict(zip(urls, executor.map(self.get_redfish_url, urls)))
+
+    def get_monitoring_urls(self) -> dict[str, list[str]]:
+        """Return the Redfish urls consumed by the read_* functions, per group of metrics."""
+        # To be implemented by vendors
+        return {}
+
+    def prefetch_monitoring(self) -> dict[str, dict]:
+        """Fetch all the Redfish urls needed by a monitoring sample at once."""
+        # Urls of the disabled groups are not fetched, several groups can share an url
+        urls = self.get_monitoring_urls()
+        enabled_urls = [
+            url
+            for group in BMC_METRIC_GROUPS
+            if self.is_enabled(group)
+            for url in urls.get(group, [])
+        ]
+        return self.get_redfish_urls(list(dict.fromkeys(enabled_urls)))
+
+    def invalidate_redfish_cache(self):
+        """Forget all the cached Redfish answers."""
+        with self.redfish_cache_lock:
+            self.redfish_cache.clear()
+
+    def begin_sample(self):
+        """Start a new monitoring sample with fresh Redfish answers."""
+        self.invalidate_redfish_cache()
+        self.prefetch_monitoring()
+
+    def get_redfish_field(self, content, field: str) -> list:
+        """Return a list field of a Redfish answer, or an empty list if missing."""
+        # get_redfish_url() returns None or {} on errors.
+        # Let's report an empty list so the readers can process the next samples
+        # instead of crashing, and only log it once to avoid flooding the logs.
+        values = (content or {}).get(field)
+        if not values:
+            if field not in self.missing_fields:
+                self.missing_fields.add(field)
+                logging.warning(f"No {field} reported by the BMC")
+            return []
+        return values
+
     def get_thermal(self):
         return {}
 
@@ -139,15 +453,14 @@ class BMC(External):
     ) -> dict[str, dict[str, MonitorMetric]]:
         """Return fans from server"""
         # Generic for now, could be override by vendors
-        if str(FanContext.FAN) not in fans:
-            fans[str(FanContext.FAN)] = {}  # type: ignore[no-redef]
-        for f in self.get_thermal().get("Fans"):
+        # Metrics are created at the first sample, then only updated
+        fan_metrics = fans.setdefault(FAN_KEY, {})
+        for f in self.get_redfish_field(self.get_thermal(), "Fans"):
             name = f["Name"]
-            if name not in fans[str(FanContext.FAN)]:
-                fans[str(FanContext.FAN)][name] = MonitorMetric(
-                    f["Name"], f["ReadingUnits"]
-                )
-            fans[str(FanContext.FAN)][name].add(f["Reading"])
+            metric = fan_metrics.get(name)
+            if metric is None:
+                metric = fan_metrics[name] = MonitorMetric(name, f["ReadingUnits"])
+            metric.add(f["Reading"])
         return fans
 
     def get_power(self):
@@ -159,14 +472,13 @@ class BMC(External):
     ) -> dict[str, dict[str, Power]]:
         """Return power consumption from server"""
         # Generic for now, could be override by vendors
-        if str(PowerContext.BMC) not in power_consumption:
-            power_consumption[str(PowerContext.BMC)] = {
-                str(PowerCategories.SERVER): Power(str(PowerCategories.SERVER))
-            }  # type: ignore[no-redef]
-
-        power_consumption[str(PowerContext.BMC)][str(PowerCategories.SERVER)].add(
-            self.get_power().get("PowerControl")[0]["PowerConsumedWatts"]
-        )
+        server = str(PowerCategories.SERVER)
+        bmc_metrics = power_consumption.get(BMC_KEY)
+        if bmc_metrics is None:
+            bmc_metrics = power_consumption[BMC_KEY] = {server: Power(server)}
+        power_control = self.get_redfish_field(self.get_power(), "PowerControl")
+        if power_control:
+            bmc_metrics[server].add(power_control[0]["PowerConsumedWatts"])
         return power_consumption
 
     def read_power_supplies(
@@ -174,15 +486,13 @@ class BMC(External):
     ) -> dict[str, dict[str, Power]]:
         """Return power supplies power from server"""
         # Generic for now, could be override by vendors
-        if str(PowerContext.BMC) not in power_supplies:
-            power_supplies[str(PowerContext.BMC)] = {}  # type: ignore[no-redef]
-        for psu in self.get_power().get("PowerSupplies"):
-            psu_name = psu["Name"].split()[0]
-            if psu["Name"] not in power_supplies[str(PowerContext.BMC)]:
-                power_supplies[str(PowerContext.BMC)][psu["Name"]] = Power(psu_name)
-            power_supplies[str(PowerContext.BMC)][psu["Name"]].add(
-                psu["PowerInputWatts"]
-            )
+        psu_metrics = power_supplies.setdefault(BMC_KEY, {})
+        for psu in self.get_redfish_field(self.get_power(), "PowerSupplies"):
+            name = psu["Name"]
+            metric = psu_metrics.get(name)
+            if metric is None:
+                metric = psu_metrics[name] = Power(name.split()[0])
+            metric.add(psu["PowerInputWatts"])
         return power_supplies
 
 
@@ -213,9 +523,21 @@ class Vendor(ABC):
         if not self.bmc:
             self.bmc = BMC(self.out_dir, self)
             self.bmc.run()
-        # This part will be generic called by the vendors
-        self.bmc.connect_redfish()
+        self.bmc.load_enabled_groups()
+        # The Redfish connection is opened by the bmc on its first Redfish call
 
     def get_bmc(self) -> BMC:
         """Return the BMC object"""
         return self.bmc
+
+    def close(self):
+        """Release the connections to the BMC."""
+        if not self.bmc:
+            return
+        # The results are already saved, a failing logout must not fail the run.
+        # Like an expired session after a long benchmark, the BMC refusing the logout
+        # raises a BadRequestError. The requests errors are subclasses of OSError.
+        try:
+            self.bmc.close()
+        except (BadRequestError, RetriesExhaustedError, OSError) as exception:
+            logging.warning(f"Cannot log out from the BMC: {exception!r}")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
 import dataclasses
 import json
 import os
@@ -12,6 +13,7 @@ from .bench.monitoring_structs import MonitorMetric
 from .config import config
 from .environment import software as env_soft
 from .environment import hardware as env_hw
+from .environment.vendors.vendor import parse_metric_groups
 from .utils import helpers as h
 from .tuning import setup as tuning_setup
 from .utils.hwlogging import init_logging
@@ -29,17 +31,24 @@ def main():
 
     tuning_setup.Tuning(tuning_out_dir).apply()
     env = env_soft.Environment(out_dir)
-    hw = env_hw.Hardware(out_dir)
+    with contextlib.ExitStack() as stack:
+        hw = env_hw.Hardware(out_dir)
+        # The BMC session must be closed, even if a benchmark fails
+        stack.callback(hw.get_vendor().close)
+        if args.bmc_metrics:
+            hw.get_vendor().get_bmc().set_enabled_groups(
+                parse_metric_groups(args.bmc_metrics)
+            )
 
-    benches = benchmarks.Benchmarks(out_dir, config.Config(args.config, hw), hw)
-    benches.parse_config()
+        benches = benchmarks.Benchmarks(out_dir, config.Config(args.config, hw), hw)
+        benches.parse_config()
 
-    results = benches.run()
-    benches.dump()
+        results = benches.run()
+        benches.dump()
 
-    out = format_output(env.dump(), hw.dump(), results, benches.config)
+        out = format_output(env.dump(), hw.dump(), results, benches.config)
 
-    write_output(out_dir, out)
+        write_output(out_dir, out)
 
 
 def is_root():
@@ -64,6 +73,10 @@ def parse_options():
     parser.add_argument(
         "-c", "--config", help="Specify the config file to load", required=True
     )
+    parser.add_argument(
+        "--bmc-metrics",
+        help="Comma separated list of BMC metrics to monitor (thermal,fan,power)",
+    )
     return parser.parse_args()
 
 